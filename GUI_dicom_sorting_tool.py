@@ -1,116 +1,378 @@
 import sys
 import os
 import logging
+import logging.handlers
+import queue
+import mmap
 import multiprocessing
-from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-                             QPushButton, QFileDialog, QRadioButton, QButtonGroup, QMessageBox, 
+import threading
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, as_completed, wait)
+from dataclasses import dataclass
+from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QPushButton, QFileDialog, QRadioButton, QButtonGroup, QMessageBox,
                              QGroupBox, QCheckBox, QProgressDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-import pydicom
-from dicom_sorting_tool import sort_dicom, decompress_dataset, read_id_correlation
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal
+
+# pydicom and dicom_sorting_tool are imported lazily inside the workers:
+# their import chains add noticeable cold-start latency before the window
+# appears, and the GUI thread itself never touches them.
+
+# Files above this size are read through mmap instead of a plain read.
+_MMAP_THRESHOLD = 50 * 1024 * 1024
+
+# Static dialog texts, built once at import instead of on every click.
+_ANON_INFO_TEXT = (
+    "No Anonymization: No changes to patient information.\n\n"
+    "Basic Anonymization:\n"
+    "- Anonymizes: PatientName, PatientID\n"
+    "- If no ID correlation file is provided, a random 8-character code will be assigned as the new PatientID\n\n"
+    "Strict Anonymization:\n"
+    "- Includes all Basic Anonymization changes\n"
+    "- Additionally anonymizes all tags starting with 'Patient'\n"
+    "- Removes all private tags\n"
+    "- Generates dummy UIDs for: StudyInstanceUID, SeriesInstanceUID, SOPInstanceUID\n"
+    "- Anonymizes Accession Number with a random 16-digit number\n"
+    "- Eliminates most private tags. Preserves prepulse IR delay for TFE sequences\n\n"
+    "Additional Anonymization Options:\n"
+    "- Anonymize Birth Date: Sets PatientBirthDate to January 1st of the same year\n"
+    "- Anonymize Acquisition Date: Sets AcquisitionDate to January 1st of the same year\n\n"
+    "Note: If an ID correlation file is provided, it will be used to map old PatientIDs to new ones. "
+    "If no correlation is provided, a consistent random code will be generated for each unique PatientID.")
+
+_ID_INFO_TEXT = (
+    "The ID correlation file should be a TSV (Tab-Separated Values) file with two columns:\n\n"
+    "Column 1: Original Patient ID\n"
+    "Column 2: New Patient ID\n\n"
+    "Example:\n"
+    "OldID1  NewID1\n"
+    "OldID2  NewID2\n\n"
+    "You can choose to read the original ID from either PatientID or PatientName using the checkbox.")
+
+_HELP_TEXT = (
+    "This tool provides two main functions:\n\n"
+    "1. DICOM Sorting: Organizes and optionally anonymizes DICOM files.\n"
+    "   - Select input and output directories\n"
+    "   - Choose anonymization level\n"
+    "   - Optionally provide an ID correlation file\n"
+    "   - Choose to read original ID from PatientName or PatientID\n"
+    "   - Select additional options (decompression, skipping certain images)\n"
+    "   - Choose to anonymize Birth Date and/or Acquisition Date\n"
+    "   - Files are sorted into the following structure:\n"
+    "     PatientID/StudyDate/SeriesNumber_SeriesDescription/\n\n"
+    "2. In-place Decompression: Decompresses DICOM files in their original location.\n"
+    "   - Select the directory containing DICOM files\n"
+    "   - The tool will recursively find and decompress all DICOM files\n\n"
+    "For more detailed information, click the '?' buttons next to specific options.\n\n"
+    "This is an open-source project licensed under the GNU General Public License v3.0.\n"
+    "For updates, issues, or contributions, please visit:\n"
+    "https://github.com/navalpablo/dicom_sorting_toolkit")
+
+def _warm_pydicom():
+    # Pool initializer: pay the pydicom import once per worker at spawn
+    # time instead of on the first file each worker processes.
+    import pydicom  # noqa: F401
+    import dicom_sorting_tool  # noqa: F401
+
+# Compressed transfer syntax UIDs, generated from pydicom's uid module on
+# first use (pydicom is imported lazily). A str hash lookup per file beats
+# the UID attribute-chain + is_compressed property call.
+_compressed_ts = None
+
+def _compressed_ts_uids():
+    global _compressed_ts
+    if _compressed_ts is None:
+        from pydicom.uid import AllTransferSyntaxes
+        _compressed_ts = frozenset(str(uid) for uid in AllTransferSyntaxes
+                                   if uid.is_compressed)
+    return _compressed_ts
+
+def _is_dicom(file_path):
+    # Cheap triage: a DICOM file carries the 'DICM' marker after the
+    # 128-byte preamble. One short read rejects JSON/PNG/etc. without
+    # paying for a pydicom parse and InvalidDicomError unwind.
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(128)
+            return f.read(4) == b'DICM'
+    except OSError:
+        return False
+
+def _scan_one_dir(path):
+    # Scan a single directory: sort entries into subdirectories and
+    # DICM/non-DICOM files. Both readdir and the magic sniff are I/O that
+    # releases the GIL, so directories can be scanned concurrently.
+    subdirs = []
+    dicom_files = []
+    non_dicom = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    if _is_dicom(entry.path):
+                        dicom_files.append(entry.path)
+                    else:
+                        logging.warning(f"Not a DICOM file: {entry.path}")
+                        non_dicom += 1
+    except OSError as e:
+        # Unreadable directories are routine on clinical shares; skip them
+        # like os.walk would instead of aborting the whole scan.
+        logging.warning(f"Skipping unreadable directory {path}: {e}")
+    return subdirs, dicom_files, non_dicom
+
+def _scan_dicom_files(root, max_workers=16):
+    # Breadth-first traversal with one thread-pool task per directory:
+    # walk, DICM filter and count happen in one pass, and on high-latency
+    # filesystems (NFS/SMB) many readdir round-trips run in parallel.
+    # Returns (dicom_files, non_dicom_count).
+    dicom_files = []
+    non_dicom = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(_scan_one_dir, root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, files, junk = future.result()
+                dicom_files.extend(files)
+                non_dicom += junk
+                for subdir in subdirs:
+                    pending.add(pool.submit(_scan_one_dir, subdir))
+    return dicom_files, non_dicom
+
+def _decompress_one(file_path):
+    # Top-level so it is picklable for the process pool. Returns a
+    # (file_path, status) tuple; status is one of 'decompressed',
+    # 'skipped', 'no_meta' or 'error:<message>'.
+    import pydicom
+    from pydicom.filereader import _read_file_meta_info, read_preamble
+    from pydicom.filewriter import dcmwrite
+    from dicom_sorting_tool import decompress_dataset
+    try:
+        with open(file_path, 'rb') as fp:
+            # Meta-only probe on the open handle: the transfer syntax
+            # lives in the group 0002 file meta at the head of the file,
+            # so read just that instead of the full (non-pixel) header.
+            read_preamble(fp, False)
+            file_meta = _read_file_meta_info(fp)
+
+            # Check if the file is compressed
+            if not hasattr(file_meta, 'TransferSyntaxUID'):
+                return file_path, 'no_meta'
+            if str(file_meta.TransferSyntaxUID) in _compressed_ts_uids():
+                if os.path.getsize(file_path) > _MMAP_THRESHOLD:
+                    # Large multi-frame files: read through a memory map so
+                    # the kernel page cache backs the buffer instead of a
+                    # private copy of the whole file.
+                    with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        dataset = pydicom.dcmread(mm)
+                else:
+                    # Rewind and reuse the same handle for the full read;
+                    # defer_size keeps large non-pixel elements (private
+                    # blobs, spectroscopy data...) on disk until the write
+                    # stage re-reads them, bounding peak RSS per worker.
+                    fp.seek(0)
+                    dataset = pydicom.dcmread(fp, defer_size='4 KB')
+            else:
+                return file_path, 'skipped'
+        decompressed = decompress_dataset(dataset)
+        if str(decompressed.file_meta.TransferSyntaxUID) in _compressed_ts_uids():
+            # decompress_dataset swallows decode failures and returns the
+            # dataset unchanged; leave the file alone rather than rewrite
+            # the still-compressed bytes and report a decompression.
+            return file_path, 'error:could not decompress pixel data'
+        # Write to a sibling temp file and rename so a crash or
+        # cancel can never leave a half-written DICOM behind.
+        tmp_path = file_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as fp:
+                dcmwrite(fp, decompressed)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return file_path, 'decompressed'
+    except pydicom.errors.InvalidDicomError:
+        return file_path, 'not_dicom'
+    except Exception as e:
+        return file_path, f'error:{str(e)}'
 
 class DecompressionThread(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, input_dir):
+    def __init__(self, input_dir, executor):
         QThread.__init__(self)
         self.input_dir = input_dir
+        self.executor = executor
+        self.cancel_flag = multiprocessing.Value('b', False)
+
+    def cancel(self):
+        self.cancel_flag.value = True
 
     def run(self):
         try:
-            total_files = sum([len(files) for r, d, files in os.walk(self.input_dir)])
-            processed = 0
+            files, non_dicom_count = _scan_dicom_files(self.input_dir)
+            total_files = len(files)
             decompressed_count = 0
-            skipped_count = 0
-
-            for root, dirs, files in os.walk(self.input_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        # Attempt to read all files as DICOM
-                        dataset = pydicom.dcmread(file_path)
-                        
-                        # Check if the file is compressed
-                        if hasattr(dataset, 'file_meta') and hasattr(dataset.file_meta, 'TransferSyntaxUID'):
-                            if dataset.file_meta.TransferSyntaxUID.is_compressed:
-                                decompressed = decompress_dataset(dataset)
-                                decompressed.save_as(file_path)
-                                decompressed_count += 1
-                                logging.info(f"Decompressed: {file_path}")
-                            else:
-                                logging.info(f"Already uncompressed: {file_path}")
-                                skipped_count += 1
-                        else:
-                            logging.warning(f"File lacks transfer syntax information: {file_path}")
-                            skipped_count += 1
-                    
-                    except pydicom.errors.InvalidDicomError:
-                        logging.warning(f"Not a DICOM file: {file_path}")
-                        skipped_count += 1
-                    except Exception as e:
-                        self.error.emit(f"Error processing {file_path}: {str(e)}")
-                        skipped_count += 1
-
-                    processed += 1
-                    self.progress.emit(int(processed / total_files * 100))
+            skipped_count = non_dicom_count
+            # Decompression is CPU-bound per file, so fan out over all cores
+            # and keep signal traffic low by emitting only when the integer
+            # percentage actually changes.
+            last_pct = -1
+
+            # The executor is owned by the GUI and shared across runs, so
+            # submit individual futures (cancellable) rather than map().
+            futures = [self.executor.submit(_decompress_one, path) for path in files]
+            for processed, future in enumerate(as_completed(futures), start=1):
+                if self.cancel_flag.value:
+                    # Cooperative cancel: drop pending work and leave
+                    # files that were not yet touched intact.
+                    for f in futures:
+                        f.cancel()
+                    logging.info("Decompression was cancelled.")
+                    return
+
+                file_path, status = future.result()
+                if status == 'decompressed':
+                    decompressed_count += 1
+                    logging.info(f"Decompressed: {file_path}")
+                elif status == 'skipped':
+                    skipped_count += 1
+                    logging.info(f"Already uncompressed: {file_path}")
+                elif status == 'no_meta':
+                    skipped_count += 1
+                    logging.warning(f"File lacks transfer syntax information: {file_path}")
+                elif status == 'not_dicom':
+                    skipped_count += 1
+                    logging.warning(f"Not a DICOM file: {file_path}")
+                else:
+                    skipped_count += 1
+                    self.error.emit(f"Error processing {file_path}: {status[len('error:'):]}")
+
+                new_pct = processed * 100 // total_files
+                if new_pct != last_pct:
+                    self.progress.emit(new_pct)
+                    last_pct = new_pct
 
             logging.info(f"Decompression completed. "
                          f"Decompressed: {decompressed_count}, "
                          f"Skipped: {skipped_count}, "
-                         f"Total files: {total_files}")
+                         f"Total files: {total_files + non_dicom_count}")
             self.finished.emit()
-        
+
         except Exception as e:
             self.error.emit(f"An error occurred during decompression: {str(e)}")
             
+@dataclass
+class SortingOptions:
+    # Everything the sorting run needs, gathered from the widgets in one
+    # place instead of threading 11 positional arguments around.
+    input_dir: str
+    output_dir: str
+    anonymize: bool
+    strict_anonymize: bool
+    decompress: bool
+    skip_derived: bool
+    skip_burned: bool
+    id_from_name: bool
+    anonymize_birth_date: bool
+    anonymize_acquisition_date: bool
+
 class SortingThread(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, input_dir, output_dir, anonymize, id_map, decompress, strict_anonymize, skip_derived, skip_burned, id_from_name, anonymize_birth_date, anonymize_acquisition_date):
+    def __init__(self, options, id_map):
         QThread.__init__(self)
-        self.input_dir = input_dir
-        self.output_dir = output_dir
-        self.anonymize = anonymize
+        self.options = options
         self.id_map = id_map
-        self.decompress = decompress
-        self.strict_anonymize = strict_anonymize
-        self.skip_derived = skip_derived
-        self.skip_burned = skip_burned
-        self.id_from_name = id_from_name
-        self.anonymize_birth_date = anonymize_birth_date
-        self.anonymize_acquisition_date = anonymize_acquisition_date
-        self.cancel_flag = multiprocessing.Value('b', False)
+        # Plain Event: sort_dicom runs in this process, so no need for the
+        # semaphore-backed multiprocessing.Value here.
+        self.cancel_flag = threading.Event()
 
     def run(self):
         try:
-            sort_dicom(self.input_dir, self.output_dir, self.anonymize, self.id_map, 
-                       self.decompress, self.strict_anonymize, self.skip_derived, 
-                       self.skip_burned, self.id_from_name, self.anonymize_birth_date,
-                       self.anonymize_acquisition_date, progress_callback=self.progress.emit,
+            from dicom_sorting_tool import sort_dicom
+            opts = self.options
+            sort_dicom(opts.input_dir, opts.output_dir, opts.anonymize, self.id_map,
+                       opts.decompress, opts.strict_anonymize, opts.skip_derived,
+                       opts.skip_burned, opts.id_from_name, opts.anonymize_birth_date,
+                       opts.anonymize_acquisition_date, progress_callback=self.progress.emit,
                        cancel_flag=self.cancel_flag)
-            if not self.cancel_flag.value:
+            if not self.cancel_flag.is_set():
                 self.finished.emit()
         except Exception as e:
             self.error.emit(str(e))
 
     def cancel(self):
-        self.cancel_flag.value = True
+        self.cancel_flag.set()
             
 
+# Parsed ID correlation files keyed by (path, mtime); repeated runs with
+# an unchanged file skip the re-parse entirely.
+_id_map_cache = {}
+
+def _load_id_map(path):
+    from dicom_sorting_tool import read_id_correlation
+    key = (path, os.path.getmtime(path))
+    if key not in _id_map_cache:
+        if len(_id_map_cache) >= 8:
+            _id_map_cache.clear()
+        _id_map_cache[key] = read_id_correlation(path)
+    return _id_map_cache[key]
+
+class IdMapLoaderSignals(QObject):
+    loaded = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class IdMapLoader(QRunnable):
+    # Parses the ID correlation file on the global thread pool so a large
+    # mapping does not freeze the GUI before the sorting thread starts.
+    def __init__(self, path):
+        QRunnable.__init__(self)
+        self.path = path
+        self.signals = IdMapLoaderSignals()
+
+    def run(self):
+        try:
+            self.signals.loaded.emit(_load_id_map(self.path))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
 class DicomSortingGUI(QWidget):
     def __init__(self):
         super().__init__()
         self.sorting_thread = None
+        self.decomp_thread = None
         self.progress_dialog = None
+        # One warm process pool for the lifetime of the window; workers are
+        # spawned on first use and reused by every subsequent run.
+        self.worker_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                               initializer=_warm_pydicom)
+        # Worker progress signals only store the latest value; this timer
+        # pushes it to the dialog at 10 Hz so repaint cost stays constant
+        # no matter how fast the workers report.
+        self._latest_pct = 0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_progress)
         self.initUI()
 
-        # Set up logging
-        logging.basicConfig(filename='dicom_sorting_gui.log', level=logging.DEBUG,
-                            format='%(asctime)s - %(levelname)s - %(message)s')
+        # Set up logging through a queue so worker threads only pay for an
+        # enqueue; a background listener does the actual file writes.
+        log_queue = queue.Queue(-1)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.DEBUG)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        file_handler = logging.FileHandler('dicom_sorting_gui.log')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._log_listener.start()
 
     def initUI(self):
         layout = QVBoxLayout()
@@ -253,6 +515,11 @@ class DicomSortingGUI(QWidget):
         self.setWindowTitle('DICOM Sorting Toolkit v0.1.2')
         self.show()
 
+    def closeEvent(self, event):
+        self.worker_pool.shutdown(wait=False, cancel_futures=True)
+        self._log_listener.stop()
+        super().closeEvent(event)
+
     def browse_directory(self, line_edit):
         directory = QFileDialog.getExistingDirectory(self, "Select Directory")
         if directory:
@@ -264,67 +531,18 @@ class DicomSortingGUI(QWidget):
             line_edit.setText(file)
 
     def show_anon_info(self):
-        QMessageBox.information(self, "Anonymization Info",
-            "No Anonymization: No changes to patient information.\n\n"
-            "Basic Anonymization:\n"
-            "- Anonymizes: PatientName, PatientID\n"
-            "- If no ID correlation file is provided, a random 8-character code will be assigned as the new PatientID\n\n"
-            "Strict Anonymization:\n"
-            "- Includes all Basic Anonymization changes\n"
-            "- Additionally anonymizes all tags starting with 'Patient'\n"
-            "- Removes all private tags\n"
-            "- Generates dummy UIDs for: StudyInstanceUID, SeriesInstanceUID, SOPInstanceUID\n"
-            "- Anonymizes Accession Number with a random 16-digit number\n"
-            "- Eliminates most private tags. Preserves prepulse IR delay for TFE sequences\n\n"
-            "Additional Anonymization Options:\n"
-            "- Anonymize Birth Date: Sets PatientBirthDate to January 1st of the same year\n"
-            "- Anonymize Acquisition Date: Sets AcquisitionDate to January 1st of the same year\n\n"
-            "Note: If an ID correlation file is provided, it will be used to map old PatientIDs to new ones. "
-            "If no correlation is provided, a consistent random code will be generated for each unique PatientID.")
+        QMessageBox.information(self, "Anonymization Info", _ANON_INFO_TEXT)
 
 
     def show_id_info(self):
-        QMessageBox.information(self, "ID Correlation File Info",
-                                "The ID correlation file should be a TSV (Tab-Separated Values) file with two columns:\n\n"
-                                "Column 1: Original Patient ID\n"
-                                "Column 2: New Patient ID\n\n"
-                                "Example:\n"
-                                "OldID1  NewID1\n"
-                                "OldID2  NewID2\n\n"
-                                "You can choose to read the original ID from either PatientID or PatientName using the checkbox.")
+        QMessageBox.information(self, "ID Correlation File Info", _ID_INFO_TEXT)
 
     def show_help(self):
-        QMessageBox.information(self, "Help",
-                                "This tool provides two main functions:\n\n"
-                                "1. DICOM Sorting: Organizes and optionally anonymizes DICOM files.\n"
-                                "   - Select input and output directories\n"
-                                "   - Choose anonymization level\n"
-                                "   - Optionally provide an ID correlation file\n"
-                                "   - Choose to read original ID from PatientName or PatientID\n"
-                                "   - Select additional options (decompression, skipping certain images)\n"
-                                "   - Choose to anonymize Birth Date and/or Acquisition Date\n"
-                                "   - Files are sorted into the following structure:\n"
-                                "     PatientID/StudyDate/SeriesNumber_SeriesDescription/\n\n"
-                                "2. In-place Decompression: Decompresses DICOM files in their original location.\n"
-                                "   - Select the directory containing DICOM files\n"
-                                "   - The tool will recursively find and decompress all DICOM files\n\n"
-                                "For more detailed information, click the '?' buttons next to specific options.\n\n"
-                                "This is an open-source project licensed under the GNU General Public License v3.0.\n"
-                                "For updates, issues, or contributions, please visit:\n"
-                                "https://github.com/navalpablo/dicom_sorting_toolkit")
+        QMessageBox.information(self, "Help", _HELP_TEXT)
 
     def execute_sorting(self):
         input_dir = self.input_edit.text()
         output_dir = self.output_edit.text()
-        basic_anonymize = self.basic_anon_radio.isChecked()
-        strict_anonymize = self.strict_anon_radio.isChecked()
-        id_map = read_id_correlation(self.id_edit.text()) if self.id_edit.text() else None
-        decompress = self.decompress_check.isChecked()
-        skip_derived = self.skip_derived_check.isChecked()
-        skip_burned = self.skip_burned_check.isChecked()
-        id_from_name = self.id_from_name_check.isChecked()
-        anonymize_birth_date = self.anonymize_birth_date_check.isChecked()
-        anonymize_acquisition_date = self.anonymize_acquisition_date_check.isChecked()
 
         if not input_dir or not output_dir:
             QMessageBox.warning(self, "Error", "Please select both input and output directories.")
@@ -336,16 +554,47 @@ class DicomSortingGUI(QWidget):
         self.progress_dialog.setValue(0)
         self.progress_dialog.canceled.connect(self.cancel_sorting)
         self.progress_dialog.show()
+        self._latest_pct = 0
+        self._progress_timer.start()
+
+        id_path = self.id_edit.text()
+        if id_path:
+            # Parse the correlation file off the GUI thread; start_sorting
+            # runs once the map is ready.
+            self.progress_dialog.setLabelText("Loading ID correlation file...")
+            self.id_map_loader = IdMapLoader(id_path)
+            self.id_map_loader.signals.loaded.connect(self.start_sorting)
+            self.id_map_loader.signals.error.connect(self.sorting_error)
+            QThreadPool.globalInstance().start(self.id_map_loader)
+        else:
+            self.start_sorting(None)
+
+    def start_sorting(self, id_map):
+        if not self.progress_dialog:
+            return  # cancelled while the ID map was loading
+        self.progress_dialog.setLabelText("Sorting DICOM files...")
 
-        self.sorting_thread = SortingThread(input_dir, output_dir, basic_anonymize or strict_anonymize, 
-                                            id_map, decompress, strict_anonymize, skip_derived, skip_burned, 
-                                            id_from_name, anonymize_birth_date, anonymize_acquisition_date)
+        strict_anonymize = self.strict_anon_radio.isChecked()
+        options = SortingOptions(
+            input_dir=self.input_edit.text(),
+            output_dir=self.output_edit.text(),
+            anonymize=self.basic_anon_radio.isChecked() or strict_anonymize,
+            strict_anonymize=strict_anonymize,
+            decompress=self.decompress_check.isChecked(),
+            skip_derived=self.skip_derived_check.isChecked(),
+            skip_burned=self.skip_burned_check.isChecked(),
+            id_from_name=self.id_from_name_check.isChecked(),
+            anonymize_birth_date=self.anonymize_birth_date_check.isChecked(),
+            anonymize_acquisition_date=self.anonymize_acquisition_date_check.isChecked())
+
+        self.sorting_thread = SortingThread(options, id_map)
         self.sorting_thread.progress.connect(self.update_sorting_progress)
         self.sorting_thread.finished.connect(self.sorting_finished)
         self.sorting_thread.error.connect(self.sorting_error)
         self.sorting_thread.start()
 
     def cancel_sorting(self):
+        self._progress_timer.stop()
         if self.sorting_thread and self.sorting_thread.isRunning():
             self.sorting_thread.cancel()
             self.sorting_thread.wait()
@@ -354,11 +603,16 @@ class DicomSortingGUI(QWidget):
         self.sorting_thread = None
         self.progress_dialog = None
         
-    def update_sorting_progress(self, value):
+    def _flush_progress(self):
         if self.progress_dialog and not self.progress_dialog.wasCanceled():
-            self.progress_dialog.setValue(value)
-        
+            self.progress_dialog.setValue(self._latest_pct)
+
+    def update_sorting_progress(self, value):
+        self._latest_pct = value
+
+
     def sorting_finished(self):
+        self._progress_timer.stop()
         if self.progress_dialog:
             self.progress_dialog.close()
         QMessageBox.information(self, "Success", "DICOM sorting completed successfully.")
@@ -366,6 +620,7 @@ class DicomSortingGUI(QWidget):
         self.progress_dialog = None
 
     def sorting_error(self, error_message):
+        self._progress_timer.stop()
         if self.progress_dialog:
             self.progress_dialog.close()
         QMessageBox.critical(self, "Error", f"An error occurred during sorting: {error_message}")
@@ -378,7 +633,7 @@ class DicomSortingGUI(QWidget):
             QMessageBox.warning(self, "Error", "Please select an input directory for decompression.")
             return
 
-        self.decomp_thread = DecompressionThread(input_dir)
+        self.decomp_thread = DecompressionThread(input_dir, self.worker_pool)
         self.decomp_thread.progress.connect(self.update_progress)
         self.decomp_thread.finished.connect(self.decompression_finished)
         self.decomp_thread.error.connect(self.decompression_error)
@@ -387,14 +642,26 @@ class DicomSortingGUI(QWidget):
         self.progress_dialog = QProgressDialog("Decompressing DICOM files...", "Cancel", 0, 100, self)
         self.progress_dialog.setWindowModality(Qt.WindowModal)
         self.progress_dialog.setAutoClose(False)
-        self.progress_dialog.canceled.connect(self.decomp_thread.terminate)
+        self.progress_dialog.canceled.connect(self.cancel_decompression)
         self.progress_dialog.show()
+        self._latest_pct = 0
+        self._progress_timer.start()
+
+    def cancel_decompression(self):
+        self._progress_timer.stop()
+        if self.decomp_thread and self.decomp_thread.isRunning():
+            self.decomp_thread.cancel()
+            self.decomp_thread.wait()
+        if self.progress_dialog:
+            self.progress_dialog.close()
+        self.decomp_thread = None
+        self.progress_dialog = None
 
     def update_progress(self, value):
-        if self.progress_dialog:
-            self.progress_dialog.setValue(value)
+        self._latest_pct = value
 
     def decompression_finished(self):
+        self._progress_timer.stop()
         if self.progress_dialog:
             self.progress_dialog.close()
         QMessageBox.information(self, "Success", "In-place decompression completed successfully.")
@@ -402,6 +669,7 @@ class DicomSortingGUI(QWidget):
         self.progress_dialog = None
 
     def decompression_error(self, error_message):
+        self._progress_timer.stop()
         if self.progress_dialog:
             self.progress_dialog.close()
         QMessageBox.critical(self, "Error", f"An error occurred during decompression: {error_message}")
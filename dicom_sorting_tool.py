@@ -1,13 +1,17 @@
 import os
+import shutil
 import argparse
 import pydicom
 from pathvalidate import sanitize_filepath
 from tqdm import tqdm
 import re
 import multiprocessing
+import multiprocessing.util
 import logging
+import logging.handlers
 import time
 from datetime import datetime
+import functools
 import hashlib
 import warnings
 import random
@@ -15,12 +19,22 @@ import random
 # Suppress specific warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="pydicom.valuerep")
 
-# Set up logging
+# Patterns and translation tables used on every file/line, compiled once.
+_ID_SPLIT_RE = re.compile(r'[,\s\t]+')
+_NON_DICOM_EXT = ('.png', '.jpeg', '.jpg', '.gif', '.bmp')
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_DESCRIPTION_TRANS = str.maketrans({' ': '_', '*': None, '.': '_'})
+
+# Set up logging. Records are buffered in memory and flushed to the file
+# in batches of 1000 (immediately on ERROR), so per-file logging costs an
+# append to a list instead of a disk write. CLI runs default to WARNING;
+# --verbose raises the level back to INFO.
 log_file = 'dicom_processing.log'
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s',
-                    filename=log_file,
-                    filemode='w')
+_file_handler = logging.FileHandler(log_file, mode='w')
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_memory_handler = logging.handlers.MemoryHandler(1000, flushLevel=logging.ERROR,
+                                                 target=_file_handler)
+logging.basicConfig(level=logging.WARNING, handlers=[_memory_handler])
 
 # Add console handler for error messages only
 console = logging.StreamHandler()
@@ -40,14 +54,19 @@ def read_id_correlation(file_path):
     if file_path:
         with open(file_path, 'r') as file:
             for line in file:
-                parts = re.split(r',|\s|\t', line.strip())
+                parts = _ID_SPLIT_RE.split(line.strip())
                 if len(parts) >= 2:
                     old_id, new_id = parts[0], parts[1]
                     id_map[old_id] = new_id
                 else:
-                    logging.warning(f"Invalid line format: {line}")
+                    logging.warning("Invalid line format: %s", line)
     return id_map
 
+# The generate_dummy_* helpers are deterministic, and every slice in a
+# series repeats the same PatientID/StudyDate/UIDs, so cache their
+# results. Each pool worker gets its own cache at fork, which is fine —
+# the functions are pure.
+@functools.lru_cache(maxsize=8192)
 def generate_dummy_date(original_date, anonymize_to_first_of_year=False):
     if not original_date:
         return "20000101"  # Default to January 1, 2000 if no original date
@@ -61,46 +80,67 @@ def generate_dummy_date(original_date, anonymize_to_first_of_year=False):
     except ValueError:
         return "20000101"  # Return default if original date is invalid
 
+@functools.lru_cache(maxsize=8192)
 def generate_dummy_id(original_id):
-    # Generate a consistent dummy ID based on the hash of the original ID
-    hash_object = hashlib.md5(original_id.encode())
-    return hash_object.hexdigest()[:8]  # Use first 8 characters of the hash
+    # Generate a consistent dummy ID based on the hash of the original ID.
+    # blake2b is faster than md5 here and digest_size=4 yields exactly the
+    # 8 hex characters we want without a truncating slice.
+    return hashlib.blake2b(str(original_id).encode(), digest_size=4).hexdigest()
 
+@functools.lru_cache(maxsize=8192)
 def generate_dummy_uid(original_uid):
     # Keep the prefix (1.2.840...) and replace the rest with numeric hash
     uid_parts = original_uid.split('.')
     prefix = '.'.join(uid_parts[:4])  # Keep the first 4 parts of the UID
     
-    # Generate a numeric hash
-    hash_object = hashlib.sha256(original_uid.encode())
-    numeric_hash = ''.join([str(int(c, 16)) for c in hash_object.hexdigest()])
-    
+    # Generate a numeric hash straight from the digest bytes instead of
+    # expanding a hex digest digit by digit in Python
+    digest = hashlib.blake2b(original_uid.encode(), digest_size=8).digest()
+    numeric_hash = str(int.from_bytes(digest, 'big'))
+
     # Use the first 16 digits of the numeric hash
     return f"{prefix}.{numeric_hash[:16]}"
 
 def generate_dummy_accession_number():
     return ''.join([str(random.randint(0, 9)) for _ in range(16)])
 
-def anonymize_dicom_tags(dataset, id_map=None, strict=False, id_from_name=False, anonymize_birth_date=False, anonymize_acquisition_date=False):
-    # List of tags to preserve in both basic and strict anonymization
-    preserved_tags = [
-        "00080070", "00081090", "00181030", "00189423", "00080020", "00180087",
-        "00080080", "00200011", "0008103E", "00540081", "00181310", "00280030",
-        "00180088", "00180050", "00180080", "00180081", "00180086", "00180091",
-        "00180082", "00181314", "00080008", "00189073", "2001101B", "200110C8"
-    ]
+# Keywords the strict pass must not touch again: the first three are
+# rewritten explicitly before the loop, the second set is cleared rather
+# than dummied.
+_ANON_HANDLED_ABOVE = frozenset({'PatientID', 'PatientName', 'PatientBirthDate'})
+_ANON_PATIENT_CLEAR = frozenset({'PatientSex', 'PatientAge', 'PatientWeight', 'PatientSize'})
+
+# Tags to preserve in both basic and strict anonymization
+PRESERVED_TAGS = frozenset({
+    "00080070", "00081090", "00181030", "00189423", "00080020", "00180087",
+    "00080080", "00200011", "0008103E", "00540081", "00181310", "00280030",
+    "00180088", "00180050", "00180080", "00180081", "00180086", "00180091",
+    "00180082", "00181314", "00080008", "00189073", "2001101B", "200110C8",
+})
 
-    # Store values of preserved tags
-    preserved_values = {tag: dataset.get(tag) for tag in preserved_tags if tag in dataset}
+def anonymize_dicom_tags(dataset, id_map=None, strict=False, id_from_name=False, anonymize_birth_date=False, anonymize_acquisition_date=False):
+    # Basic anonymization with no id_map only rewrites the patient
+    # identity tags and, when requested, AcquisitionDate; if none of them
+    # are present there is nothing to do.
+    if not strict and not id_map:
+        if ('PatientID' not in dataset and 'PatientName' not in dataset
+                and 'PatientBirthDate' not in dataset
+                and not (anonymize_acquisition_date and 'AcquisitionDate' in dataset)):
+            return dataset, None
+
+    # Store values of preserved tags; only the strict pass can clobber
+    # them, so skip the snapshot otherwise
+    preserved_values = {tag: dataset.get(tag) for tag in PRESERVED_TAGS if tag in dataset} if strict else {}
 
     # Handle PatientID and PatientName
+    missing_id = None
     original_id = dataset.PatientName if id_from_name else dataset.PatientID
     if id_map and original_id in id_map:
         new_id = id_map[original_id]
     else:
         new_id = generate_dummy_id(original_id)
-        missing_ids.add(original_id)
-    
+        missing_id = str(original_id)
+
     dataset.PatientID = new_id
     dataset.PatientName = new_id
 
@@ -115,96 +155,124 @@ def anonymize_dicom_tags(dataset, id_map=None, strict=False, id_from_name=False,
     if strict:
         # Remove all private tags
         dataset.remove_private_tags()
-        
-        # Anonymize other potentially identifying information
-        for tag in dataset.dir():
-            if tag not in preserved_tags:
-                if tag.startswith('Patient'):
-                    if tag in ['PatientID', 'PatientName', 'PatientBirthDate']:
-                        continue  # We've already handled these above
-                    elif tag in ['PatientSex', 'PatientAge', 'PatientWeight', 'PatientSize']:
-                        if tag == 'PatientSex':
-                            setattr(dataset, tag, 'O')  # 'O' for Other/Unknown
-                        elif tag == 'PatientAge':
-                            setattr(dataset, tag, '000Y')  # Set to unknown age
-                        else:
-                            setattr(dataset, tag, '')  # Clear weight and size
-                    elif 'Date' in tag:
-                        setattr(dataset, tag, generate_dummy_date(getattr(dataset, tag)))
-                    elif 'ID' in tag:
-                        setattr(dataset, tag, generate_dummy_id(getattr(dataset, tag)))
+
+        # Anonymize other potentially identifying information in a single
+        # pass over the elements; dataset.dir() would walk and sort every
+        # keyword first.
+        for elem in list(dataset):
+            keyword = elem.keyword
+            if not keyword or keyword in _ANON_HANDLED_ABOVE:
+                continue
+            if keyword.startswith('Patient'):
+                if keyword in _ANON_PATIENT_CLEAR:
+                    if keyword == 'PatientSex':
+                        dataset.PatientSex = 'O'  # 'O' for Other/Unknown
+                    elif keyword == 'PatientAge':
+                        dataset.PatientAge = '000Y'  # Set to unknown age
                     else:
-                        setattr(dataset, tag, "ANONYMIZED")
-                elif tag.endswith('UID'):
-                    original_uid = getattr(dataset, tag)
-                    setattr(dataset, tag, generate_dummy_uid(original_uid))
-                elif tag == '00080050':  # Accession Number
-                    setattr(dataset, tag, generate_dummy_accession_number())
+                        setattr(dataset, keyword, '')  # Clear weight and size
+                elif 'Date' in keyword:
+                    setattr(dataset, keyword, generate_dummy_date(getattr(dataset, keyword)))
+                elif 'ID' in keyword:
+                    setattr(dataset, keyword, generate_dummy_id(getattr(dataset, keyword)))
+                else:
+                    setattr(dataset, keyword, "ANONYMIZED")
+            elif keyword.endswith('UID'):
+                dataset[elem.tag].value = generate_dummy_uid(elem.value)
+            elif keyword == 'AccessionNumber':
+                dataset.AccessionNumber = generate_dummy_accession_number()
 
     # Restore preserved tags
     for tag, value in preserved_values.items():
         setattr(dataset, tag, value)
 
-    return dataset
+    return dataset, missing_id
+
+# Names this worker knows to be taken per destination directory, seeded
+# from one listdir on first touch so most collision probing is set
+# lookups. The set only sees this worker's writes, so the chosen
+# candidate is still confirmed against the disk — sibling workers may
+# have written the same basename since the seed.
+_dir_seen = {}
+
+# Resolved (and created) destination directory per series key, also per
+# worker process.
+_dir_cache = {}
 
 def generate_unique_filename(directory, filename):
+    seen = _dir_seen.get(directory)
+    if seen is None:
+        try:
+            seen = set(os.listdir(directory))
+        except FileNotFoundError:
+            seen = set()
+        _dir_seen[directory] = seen
+
     base_name, extension = os.path.splitext(filename)
     counter = 1
     new_filename = filename
-    while os.path.exists(os.path.join(directory, new_filename)):
+    while new_filename in seen or os.path.exists(os.path.join(directory, new_filename)):
+        seen.add(new_filename)
         new_filename = f"{base_name}_{counter}{extension}"
         counter += 1
+    seen.add(new_filename)
     return new_filename
 
 def sanitize_series_description(description):
-    description = description.replace(' ', '_').replace('*', '').replace('.', '_')
-    invalid_chars = r'<>:"/\|?*'
-    description = re.sub(f'[{re.escape(invalid_chars)}]', '', description)
+    description = description.translate(_DESCRIPTION_TRANS)
+    description = _INVALID_CHARS_RE.sub('', description)
     return sanitize_filepath(description, platform='auto')
 
+# Prefer pylibjpeg for JPEG/JPEG-LS/JPEG2000 decode when it is installed
+# (noticeably faster than the Pillow/GDCM handlers); fall back to whatever
+# handler pydicom selects otherwise.
+try:
+    import pylibjpeg  # noqa: F401
+    _DECODING_PLUGIN = 'pylibjpeg'
+except ImportError:
+    _DECODING_PLUGIN = ''
+
 def decompress_dataset(dataset):
     try:
-        dataset.decompress()
+        dataset.decompress(decoding_plugin=_DECODING_PLUGIN)
     except Exception as e:
-        logging.error(f"Error decompressing dataset: {str(e)}")
+        logging.error("Error decompressing dataset: %s", e)
     return dataset
 
+_DERIVED_MARKERS = frozenset({'DERIVED', 'SECONDARY'})
+
 def is_derived_image(dataset):
     if 'ImageType' in dataset:
         image_type = dataset.ImageType
-        return ('PRIMARY' not in image_type) or ('DERIVED' in image_type) or ('SECONDARY' in image_type)
+        # Single-valued CS elements come back as a plain str, which set()
+        # would explode into characters
+        types = {image_type} if isinstance(image_type, str) else set(image_type)
+        return 'PRIMARY' not in types or bool(types & _DERIVED_MARKERS)
     return False  # If ImageType is not present, assume it's not derived
 
 def has_burned_in_annotation(dataset):
     return dataset.get('BurnedInAnnotation', '').upper() == 'YES'
 
-def copy_dicom_image(src_file, dest_base_dir, pattern, anonymize=False, id_map=None, decompress=False, strict_anonymize=False, id_from_name=False, anonymize_birth_date=False, anonymize_acquisition_date=False):
-    non_dicom_extensions = ['.png', '.jpeg', '.jpg', '.gif', '.bmp']
-    if any(src_file.lower().endswith(ext) for ext in non_dicom_extensions):
-        return
-
-    try:
-        dataset = pydicom.dcmread(src_file)
-    except Exception as e:
-        logging.error(f'Error reading DICOM file {src_file}: {str(e)}')
-        return
+def copy_dicom_image(src_file, dest_base_dir, pattern, anonymize=False, id_map=None, decompress=False, strict_anonymize=False, id_from_name=False, anonymize_birth_date=False, anonymize_acquisition_date=False, dataset=None):
+    if dataset is None:
+        try:
+            dataset = pydicom.dcmread(src_file)
+        except Exception as e:
+            logging.error('Error reading DICOM file %s: %s', src_file, e)
+            return None
 
+    missing_id = None
     if anonymize or id_map:
-        dataset = anonymize_dicom_tags(dataset, id_map, strict_anonymize, id_from_name, anonymize_birth_date, anonymize_acquisition_date)
+        dataset, missing_id = anonymize_dicom_tags(dataset, id_map, strict_anonymize, id_from_name, anonymize_birth_date, anonymize_acquisition_date)
 
     if decompress:
         dataset = decompress_dataset(dataset)
 
-    # Combine SeriesNumber and SeriesDescription
-
+    patient_id = get_dicom_attribute(dataset, 'PatientID')
     study_time = get_dicom_attribute(dataset, 'StudyTime')
-    study_description = sanitize_series_description(get_dicom_attribute(dataset, 'StudyDescription'))
-
-
-
-    series_number = get_dicom_attribute(dataset, 'SeriesNumber').zfill(3)  # Pad with zeros to ensure proper sorting
-    series_description = sanitize_series_description(get_dicom_attribute(dataset, 'SeriesDescription'))
-    series_dir = f"{series_number}_{series_description}"  # Remove any %SeriesTime% from here
+    study_description = get_dicom_attribute(dataset, 'StudyDescription')
+    series_number = get_dicom_attribute(dataset, 'SeriesNumber')
+    series_description = get_dicom_attribute(dataset, 'SeriesDescription')
 
     # Handle StudyDate for folder structure
     study_date = get_dicom_attribute(dataset, 'StudyDate')
@@ -212,53 +280,131 @@ def copy_dicom_image(src_file, dest_base_dir, pattern, anonymize=False, id_map=N
         # If acquisition date is anonymized, use YYYY0101 format for the folder
         study_date = study_date[:4] + '0101'
 
-
-    # Replace placeholders in the pattern
-    pattern = pattern.replace('%PatientID%', get_dicom_attribute(dataset, 'PatientID'))
-    pattern = pattern.replace('%StudyDate%', study_date)
-    pattern = pattern.replace('%StudyTime%', study_time)
-    pattern = pattern.replace('%StudyDescription%', study_description)
-    pattern = pattern.replace('%SeriesDescription%', series_dir)
-    #pattern = pattern.replace('%SeriesTime%', series_time)  # Add this line
+    # Consecutive files in a series resolve to the same directory, so the
+    # sanitizing, pattern substitution and makedirs only run on the first
+    # file per series; the rest is a dict lookup.
+    key = (dest_base_dir, pattern, patient_id, study_date, study_time,
+           study_description, series_number, series_description)
+    dest_directory = _dir_cache.get(key)
+    if dest_directory is None:
+        # Combine SeriesNumber and SeriesDescription; pad the number with
+        # zeros to ensure proper sorting
+        series_dir = f"{series_number.zfill(3)}_{sanitize_series_description(series_description)}"
+
+        # Replace placeholders in the pattern
+        sub_path = pattern.replace('%PatientID%', patient_id)
+        sub_path = sub_path.replace('%StudyDate%', study_date)
+        sub_path = sub_path.replace('%StudyTime%', study_time)
+        sub_path = sub_path.replace('%StudyDescription%', sanitize_series_description(study_description))
+        sub_path = sub_path.replace('%SeriesDescription%', series_dir)
+
+        dest_directory = sanitize_filepath(os.path.join(dest_base_dir, sub_path), platform='auto')
+        os.makedirs(dest_directory, exist_ok=True)
+        _dir_cache[key] = dest_directory
 
 
-    dest_directory = sanitize_filepath(os.path.join(dest_base_dir, pattern), platform='auto')
-    os.makedirs(dest_directory, exist_ok=True)
-    
     unique_filename = generate_unique_filename(dest_directory, os.path.basename(src_file))
-    dataset.save_as(os.path.join(dest_directory, unique_filename))
+    dest_path = os.path.join(dest_directory, unique_filename)
+
+    if anonymize or id_map or decompress:
+        dataset.save_as(dest_path)
+    else:
+        # Nothing mutated the dataset, so skip the save_as re-encode and
+        # copy the source bytes as-is. A hardlink is free when the output
+        # lives on the same filesystem; otherwise fall back to a plain copy.
+        try:
+            os.link(src_file, dest_path)
+        except OSError:
+            shutil.copyfile(src_file, dest_path)
+
+    return missing_id
     
-def process_file(args):
-    file, dest_dir, pattern, anonymize, id_map, decompress, strict_anonymize, skip_derived, skip_burned_in, id_from_name, anonymize_birth_date, anonymize_acquisition_date = args
+# Per-run configuration broadcast to each pool worker once by
+# _init_worker, so task tuples carry only the filename instead of
+# re-pickling the pattern, flags and (potentially large) id_map per file.
+_worker_config = None
+
+def _init_worker(config):
+    global _worker_config
+    _worker_config = config
+    # Pool workers exit through os._exit, which skips atexit and thus
+    # logging.shutdown, so records buffered in this process's copy of the
+    # MemoryHandler would be lost. Register the flush with
+    # multiprocessing's own finalizer registry, which does run on normal
+    # worker exit.
+    multiprocessing.util.Finalize(None, _memory_handler.flush, exitpriority=0)
+
+def process_file(file):
+    if file.lower().endswith(_NON_DICOM_EXT):
+        return file, True, None
+
+    dest_dir, pattern, anonymize, id_map, decompress, strict_anonymize, skip_derived, skip_burned_in, id_from_name, anonymize_birth_date, anonymize_acquisition_date = _worker_config
+
     try:
-        dataset = pydicom.dcmread(file)
-        
-        if skip_derived and is_derived_image(dataset):
-            logging.info(f"Skipping derived image: {file}")
-            return file, False
-
-        if skip_burned_in and has_burned_in_annotation(dataset):
-            logging.info(f"Skipping image with burned-in annotation: {file}")
-            return file, False
-
-        copy_dicom_image(file, dest_dir, pattern, anonymize, id_map, decompress, strict_anonymize, id_from_name, anonymize_birth_date, anonymize_acquisition_date)
-        return file, True
+        if skip_derived or skip_burned_in:
+            # The skip filters only need two tags, so read a header-only
+            # dataset instead of parsing the whole file (pixels included)
+            # just to discard it.
+            header = pydicom.dcmread(file, stop_before_pixels=True,
+                                     specific_tags=['ImageType', 'BurnedInAnnotation'])
+
+            if skip_derived and is_derived_image(header):
+                logging.info("Skipping derived image: %s", file)
+                return file, False, None
+
+            if skip_burned_in and has_burned_in_annotation(header):
+                logging.info("Skipping image with burned-in annotation: %s", file)
+                return file, False, None
+
+        if anonymize or id_map or decompress:
+            dataset = pydicom.dcmread(file)
+        else:
+            # Sort-only run: the dataset is just used to extract the path
+            # tags and the source file is copied byte-for-byte, so there
+            # is no need to parse the pixel data at all.
+            dataset = pydicom.dcmread(file, stop_before_pixels=True)
+        missing_id = copy_dicom_image(file, dest_dir, pattern, anonymize, id_map, decompress, strict_anonymize, id_from_name, anonymize_birth_date, anonymize_acquisition_date, dataset=dataset)
+        return file, True, missing_id
     except Exception as e:
-        logging.error(f"Error processing file {file}: {str(e)}")
-        return file, False
+        logging.error("Error processing file %s: %s", file, e)
+        return file, False, None
+
+def walk_files(root):
+    try:
+        entries = list(os.scandir(root))
+    except OSError as e:
+        # Match os.walk's default tolerance: skip directories we cannot
+        # read instead of aborting the whole run.
+        logging.warning("Skipping unreadable directory %s: %s", root, e)
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_files(entry.path)
+        elif entry.is_file():
+            yield entry.path
 
 def copy_directory(src_dir, dest_dir, pattern, anonymize, id_map, decompress, strict_anonymize, skip_derived, skip_burned_in, id_from_name, anonymize_birth_date, anonymize_acquisition_date, progress_callback=None, cancel_flag=None):
-    all_files = [os.path.join(root, file) for root, _, files in os.walk(src_dir) for file in files]
-    total_files = len(all_files)
-    
-    args_list = [(file, dest_dir, pattern, anonymize, id_map, decompress, strict_anonymize, skip_derived, skip_burned_in, id_from_name, anonymize_birth_date, anonymize_acquisition_date) for file in all_files]
+    if progress_callback:
+        # Percentage progress needs the total up front, so the GUI path
+        # still materializes the file list before dispatching.
+        files = [file for file in walk_files(src_dir)]
+        total_files = len(files)
+    else:
+        # CLI runs stream paths straight into the pool so the walk and
+        # the workers overlap instead of blocking on a full tree scan.
+        files = walk_files(src_dir)
+        total_files = 0
+
+    config = (dest_dir, pattern, anonymize, id_map, decompress, strict_anonymize, skip_derived, skip_burned_in, id_from_name, anonymize_birth_date, anonymize_acquisition_date)
 
     success_count = 0
     failure_count = 0
+    last_pct = -1
 
-    with multiprocessing.Pool(processes=multiprocessing.cpu_count()) as pool:
-        for i, (file, success) in enumerate(pool.imap_unordered(process_file, args_list)):
-            if cancel_flag and cancel_flag.value:
+    with multiprocessing.Pool(processes=multiprocessing.cpu_count(),
+                              initializer=_init_worker, initargs=(config,)) as pool:
+        for i, (file, success, missing) in enumerate(pool.imap_unordered(process_file, files, chunksize=16)):
+            if cancel_flag is not None and cancel_flag.is_set():
                 pool.terminate()
                 logging.info("Sorting process was cancelled.")
                 return
@@ -267,11 +413,26 @@ def copy_directory(src_dir, dest_dir, pattern, anonymize, id_map, decompress, st
                 success_count += 1
             else:
                 failure_count += 1
+            if missing:
+                # Workers have their own copy of the module globals, so
+                # missing IDs ride the result tuple back to the parent.
+                missing_ids.add(missing)
             if progress_callback:
-                progress_callback(int((i + 1) / total_files * 100))
+                # Only report when the integer percentage changes to keep
+                # callback (and Qt signal) traffic at ~100 calls per run.
+                pct = (i + 1) * 100 // total_files
+                if pct != last_pct:
+                    progress_callback(pct)
+                    last_pct = pct
+
+        # Let the workers exit normally so their exit finalizers flush any
+        # buffered log records; the with-block's terminate() would SIGTERM
+        # them mid-buffer. Cancellation above still terminates outright.
+        pool.close()
+        pool.join()
 
     print(f"\nProcessing completed. Successes: {success_count}, Failures: {failure_count}")
-    logging.info(f"Processing completed. Successes: {success_count}, Failures: {failure_count}")
+    logging.info("Processing completed. Successes: %d, Failures: %d", success_count, failure_count)
 
 def sort_dicom(input_dir, output_dir, anonymize, id_map, decompress, strict_anonymize, skip_derived, skip_burned_in, id_from_name, anonymize_birth_date, anonymize_acquisition_date, progress_callback=None, cancel_flag=None):
     pattern = '%PatientID%/%StudyDate%_%StudyTime%_%StudyDescription%/%SeriesDescription%'
@@ -297,8 +458,12 @@ def main():
     parser.add_argument('--id_from_name', action='store_true', help='If specified, reads the original ID from PatientName instead of PatientID for ID correlation.')
     parser.add_argument('--anonymize_birth_date', action='store_true', help='If specified, anonymizes the PatientBirthDate to January 1st of the same year.')
     parser.add_argument('--anonymize_acquisition_date', action='store_true', help='If specified, anonymizes the AcquisitionDate to January 1st of the same year.')
+    parser.add_argument('--verbose', action='store_true', help='If specified, logs per-file INFO messages to the log file instead of warnings and errors only.')
     args = parser.parse_args()
 
+    if args.verbose:
+        logging.getLogger().setLevel(logging.INFO)
+
     id_map = read_id_correlation(args.ID_correlation) if args.ID_correlation else None
 
     start_time = time.time()
@@ -315,7 +480,7 @@ def main():
     end_time = time.time()
 
     print(f"Total processing time: {end_time - start_time:.2f} seconds")
-    logging.info(f"Total processing time: {end_time - start_time:.2f} seconds")
+    logging.info("Total processing time: %.2f seconds", end_time - start_time)
 
     if missing_ids:
         log_file_path = 'missing_patient_ids.log'
@@ -323,7 +488,7 @@ def main():
             for missing_id in missing_ids:
                 log_file.write(f'{missing_id}\n')
         print(f"Missing PatientIDs logged in '{log_file_path}'.")
-        logging.info(f"Missing PatientIDs logged in '{log_file_path}'.")
+        logging.info("Missing PatientIDs logged in '%s'.", log_file_path)
 
 if __name__ == '__main__':
     multiprocessing.freeze_support()